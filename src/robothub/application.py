@@ -164,14 +164,27 @@ class BaseApplication(robothub_core.RobotHubApplication, ABC):
         """
         Poll the device for new data. This method is called in a separate thread.
         """
+        # Device and stop event do not change while the thread is running, bind their methods once
+        poll = self.__device.poll
+        is_device_running = self.__device.running
+        stop_event = self.__device_stop_event
+        poll_interval = 0.0025
+        next_poll_time = time.monotonic()
         try:
-            while self.running and not self.__device_stop_event.is_set():
-                self.__device.poll()
-                if not self.__device.running():
+            while self.running and not stop_event.is_set():
+                poll()
+                if not is_device_running():
                     break
-                time.sleep(0.0025)
+
+                # Keep a steady polling rate, time spent in callbacks counts towards the interval
+                next_poll_time += poll_interval
+                remaining_time = next_poll_time - time.monotonic()
+                if remaining_time > 0:
+                    stop_event.wait(remaining_time)
+                else:
+                    next_poll_time = time.monotonic()
         finally:
-            self.__device_stop_event.set()
+            stop_event.set()
 
     def __report_info_and_stats(self) -> None:
         """
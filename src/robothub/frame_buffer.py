@@ -1,11 +1,13 @@
 import datetime
-import itertools
 import logging
+import tempfile
+import threading
+import time
 import uuid
-from collections import deque
+import warnings
 from pathlib import Path
 from queue import Queue, Empty
-from typing import Callable, Optional
+from typing import Callable, Dict, Optional
 
 from depthai_sdk.recorders.video_writers import AvWriter
 
@@ -18,14 +20,29 @@ logger = logging.getLogger(__name__)
 
 
 class FrameBuffer:
+    # Seconds without a new request after which the video worker thread exits
+    VIDEO_WORKER_IDLE_TIMEOUT = 5.0
+
     def __init__(self, maxlen: int = None):
         """
         A buffer for storing frames.
 
         :param maxlen: The maximum number of frames to store in the buffer. If None, the buffer will be unbounded.
         """
-        self.buffer = deque(maxlen=maxlen)
-        self.temporary_queues = set()
+        # Packets are stored in a ring, `_head` points to the slot that will be written next.
+        # An unbounded buffer is a plain list that only grows, so `_head` stays at zero.
+        self._maxlen = maxlen
+        self._ring: list = [None] * maxlen if maxlen else []
+        self._head = 0
+        self._size = 0
+        # Queue -> device timestamp after which the recording does not need more frames
+        self._temporary_queues: Dict[Queue, datetime.timedelta] = dict()
+        # Immutable copy of `_temporary_queues` items iterated by `default_callback`, replaced on every change
+        self._active_queues: tuple = ()
+        self._queues_lock = threading.Lock()
+        self._video_requests = Queue()
+        self._video_worker: Optional[threading.Thread] = None
+        self._video_worker_lock = threading.Lock()
 
     def get_slice(self, start: int, end: int | None = None) -> list:
         """
@@ -35,7 +52,28 @@ class FrameBuffer:
         :param end: End index. If None, return all elements from `start` to the end of the buffer.
         :return: Slice of the buffer.
         """
-        return list(itertools.islice(self.buffer, int(start), end))
+        start = max(int(start), 0)
+        end = self._size if end is None else min(int(end), self._size)
+        if start >= end:
+            return []
+
+        capacity = len(self._ring)
+        first = (self._head - self._size + start) % capacity
+        last = first + (end - start)
+        if last <= capacity:
+            return self._ring[first:last]
+        return self._ring[first:] + self._ring[:last - capacity]
+
+    def snapshot(self) -> list:
+        """
+        Get a copy of all buffered packets, ordered from the oldest to the newest.
+        Packets are kept in a ring buffer, so this replaces the deprecated `buffer` attribute.
+
+        :return: List of buffered packets.
+        """
+        if self._size < len(self._ring):
+            return self._ring[:self._size]
+        return self._ring[self._head:] + self._ring[:self._head]
 
     def save_video(self,
                    before_seconds: int,
@@ -57,35 +95,143 @@ class FrameBuffer:
         :param on_complete: Callback function to call when the video is ready. Path to the video file will be passed as the first argument.
         :param delete_after_complete: If True, delete the video file after the callback function is called. Default: False.
         """
+        recording = self._start_recording(before_seconds=before_seconds, after_seconds=after_seconds, fps=fps)
+        return self._finish_recording(*recording,
+                                      after_seconds=after_seconds,
+                                      fps=fps,
+                                      frame_width=frame_width,
+                                      frame_height=frame_height,
+                                      on_complete=on_complete,
+                                      delete_after_complete=delete_after_complete)
+
+    def save_video_async(self,
+                         before_seconds: int,
+                         after_seconds: int,
+                         fps: int,
+                         frame_width: int,
+                         frame_height: int,
+                         on_complete: Optional[Callable] = None,
+                         delete_after_complete: bool = False
+                         ) -> None:
+        """
+        Same as `save_video`, but returns immediately. Frames before the current time are captured right away,
+        the rest of the video is recorded and muxed by a background worker that handles requests one at a time.
+
+        :param before_seconds: Number of seconds to save before the current time.
+        :param after_seconds: Number of seconds to save after the current time.
+        :param fps: The FPS of the video.
+        :param frame_width: Video frame width.
+        :param frame_height: Video frame height.
+        :param on_complete: Callback function to call when the video is ready. Path to the video file will be passed as the first argument.
+        :param delete_after_complete: If True, delete the video file after the callback function is called. Default: False.
+        """
+        recording = self._start_recording(before_seconds=before_seconds, after_seconds=after_seconds, fps=fps)
+        self._video_requests.put((recording, {
+            'after_seconds': after_seconds,
+            'fps': fps,
+            'frame_width': frame_width,
+            'frame_height': frame_height,
+            'on_complete': on_complete,
+            'delete_after_complete': delete_after_complete
+        }))
+
+        with self._video_worker_lock:
+            if self._video_worker is None:
+                self._video_worker = threading.Thread(target=self._process_video_requests,
+                                                      name='frame_buffer_video_worker',
+                                                      daemon=True)
+                self._video_worker.start()
+
+    def _process_video_requests(self) -> None:
+        """
+        Finish video requests made by `save_video_async`, one at a time. Runs in a background thread.
+        The thread exits once no request arrives for a while, so it does not keep the buffer alive forever.
+        """
+        while True:
+            try:
+                recording, kwargs = self._video_requests.get(timeout=self.VIDEO_WORKER_IDLE_TIMEOUT)
+            except Empty:
+                with self._video_worker_lock:
+                    # A request put before the lock was taken is still handled by this thread
+                    if self._video_requests.empty():
+                        self._video_worker = None
+                        return
+                continue
+
+            try:
+                self._finish_recording(*recording, **kwargs)
+            except Exception:
+                logger.exception('Failed to save video.')
+
+    def _start_recording(self,
+                         before_seconds: int,
+                         after_seconds: int,
+                         fps: int
+                         ) -> tuple[list, Queue, datetime.timedelta, float]:
+        """
+        Capture frames before the current time and start collecting frames after it.
+
+        :return: Frames before the current time, queue receiving new frames, timestamp of the last frame before
+            the current time and deadline for waiting on new frames.
+        """
         if not av:
             raise ImportError('av library is not installed. Cannot save video. '
                               'Please make sure PyAV is installed (`pip install pyav`).')
 
         if before_seconds < 0 or after_seconds < 0:
             raise ValueError('`before_seconds` and `after_seconds` must be non-negative.')
-        if before_seconds * fps > len(self.buffer):
+        if before_seconds * fps > self._size:
             raise ValueError('`before_seconds` is too large. The buffer does not contain enough frames.')
 
-        # Get frames before the current time
-        video_frames_before = self.get_slice(start=(len(self.buffer) - 1) - before_seconds * fps)
-        video_frames_after = []
-        temp_queue = Queue()
-        self.temporary_queues.add(temp_queue)
+        # Get frames before the current time, the whole buffer is copied without index arithmetic
+        start = (self._size - 1) - before_seconds * fps
+        video_frames_before = self.get_slice(start=start) if start > 0 else self.snapshot()
+        if not video_frames_before:
+            raise ValueError('The buffer does not contain any frames yet.')
         latest_t_before = video_frames_before[-1].msg.getTimestampDevice()
 
-        # Get frames after the current time
-        while True:
-            try:
-                p = temp_queue.get(block=True, timeout=2.0)
+        # The queue is fed only until the requested window is covered, even if the video is muxed much later
+        temp_queue = Queue()
+        self._add_temporary_queue(temp_queue, latest_t_before + datetime.timedelta(seconds=after_seconds))
+        # Give up waiting for new frames if the producer stops, e.g. when the device disconnects
+        deadline = time.monotonic() + after_seconds + 2.0
+        return video_frames_before, temp_queue, latest_t_before, deadline
+
+    def _finish_recording(self,
+                          video_frames_before: list,
+                          temp_queue: Queue,
+                          latest_t_before: datetime.timedelta,
+                          deadline: float,
+                          after_seconds: int,
+                          fps: int,
+                          frame_width: int,
+                          frame_height: int,
+                          on_complete: Optional[Callable] = None,
+                          delete_after_complete: bool = False
+                          ) -> str | None:
+        """
+        Collect frames after the current time, mux the video and call `on_complete`.
+        """
+        video_frames_after = []
+        try:
+            # Get frames after the current time
+            while True:
+                try:
+                    p = temp_queue.get(block=True, timeout=0.25)
+                except Empty:
+                    if time.monotonic() > deadline:
+                        logger.warning('Timed out while waiting for frames, saving an incomplete video.')
+                        break
+                    continue
+
                 timestamp = p.msg.getTimestampDevice()
                 if timestamp > latest_t_before:
                     video_frames_after.append(p)
                 if timestamp - latest_t_before > datetime.timedelta(seconds=after_seconds):
                     break
-            except Empty:
-                pass
+        finally:
+            self._remove_temporary_queue(temp_queue)
 
-        self.temporary_queues.remove(temp_queue)
         video_path = self._mux_video(packets=video_frames_before + video_frames_after[:int(after_seconds * fps)],
                                      fps=fps,
                                      frame_width=frame_width,
@@ -108,17 +254,18 @@ class FrameBuffer:
         """
         Mux a list of packets into a video file and return the path to the video file.
         """
-        dir_path = Path(f'/tmp/robothub-videos/{uuid.uuid4().hex}')
-        dir_path.mkdir(parents=True)
+        dir_path = Path(tempfile.gettempdir(), 'robothub-videos')
+        dir_path.mkdir(parents=True, exist_ok=True)
         name = str(uuid.uuid4().hex)
-        av_writer = AvWriter(path=Path(dir_path),
+        av_writer = AvWriter(path=dir_path,
                              name=name,
                              fourcc='h264',
                              fps=fps,
                              frame_shape=(frame_width, frame_height))
 
+        write = av_writer.write
         for p in packets:
-            av_writer.write(p.msg)
+            write(p.msg)
 
         av_writer.close()
         video_path = Path(dir_path, name).with_suffix('.mp4')
@@ -128,10 +275,51 @@ class FrameBuffer:
         """
         Default callback for the frame buffer. It will append the packet to the buffer and put it in all temporary queues.
         """
-        self.buffer.append(packet)
-        for q in self.temporary_queues:
+        if self._maxlen is None:
+            self._ring.append(packet)
+            self._size += 1
+        elif self._maxlen:
+            self._ring[self._head] = packet
+            self._head = (self._head + 1) % self._maxlen
+            self._size = min(self._size + 1, self._maxlen)
+
+        if not self._active_queues:
+            return
+
+        timestamp = packet.msg.getTimestampDevice()
+        for q, end_timestamp in self._active_queues:
             q.put(packet)
+            # The packet past the end of the window completes the recording, later packets are not needed
+            if timestamp > end_timestamp:
+                self._remove_temporary_queue(q)
+
+    def _add_temporary_queue(self, queue: Queue, end_timestamp: datetime.timedelta) -> None:
+        with self._queues_lock:
+            self._temporary_queues[queue] = end_timestamp
+            self._active_queues = tuple(self._temporary_queues.items())
+
+    def _remove_temporary_queue(self, queue: Queue) -> None:
+        with self._queues_lock:
+            if self._temporary_queues.pop(queue, None) is not None:
+                self._active_queues = tuple(self._temporary_queues.items())
+
+    @property
+    def buffer(self) -> list:
+        """
+        Deprecated, use `snapshot()` instead. Returns a copy of the buffered packets, changes to it do not affect the buffer.
+        """
+        warnings.warn('`FrameBuffer.buffer` is deprecated, use `FrameBuffer.snapshot()` instead.',
+                      DeprecationWarning,
+                      stacklevel=2)
+        return self.snapshot()
+
+    @property
+    def size(self) -> int:
+        """
+        Number of packets currently stored in the buffer.
+        """
+        return self._size
 
     @property
     def maxlen(self) -> int:
-        return self.buffer.maxlen
+        return self._maxlen
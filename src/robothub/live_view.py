@@ -1,5 +1,4 @@
 import logging
-import threading
 import time
 from typing import List, Optional, Union, Dict, Tuple
 
@@ -22,6 +21,36 @@ __all__ = ['LiveView', 'LIVE_VIEWS']
 
 logger = logging.getLogger(__name__)
 
+# Overlay configuration sent with every published frame, it does not change between frames
+_STATIC_CONFIG = {
+    "output": {
+        "img_scale": 1.0,
+        "show_fps": False,
+        "clickable": True
+    },
+    "detection": {
+        "thickness": 1,
+        "fill_transparency": 0.05,
+        "box_roundness": 0,
+        "color": [0, 255, 0],
+        "bbox_style": 0,
+        "line_width": 0.5,
+        "line_height": 0.5,
+        "hide_label": False,
+        "label_position": 0,
+        "label_padding": 10
+    },
+    'text': {
+        'font_color': [255, 255, 0],
+        'font_transparency': 0.5,
+        'font_scale': 1.0,
+        'font_thickness': 2,
+        'bg_transparency': 0.5,
+        'bg_color': [0, 0, 0]
+    }
+}
+_BBOX_COLOR = [0, 255, 255]
+
 
 def _publish_data(stream_handle: robothub_core.StreamHandle,
                   h264_frame,
@@ -44,62 +73,36 @@ def _publish_data(stream_handle: robothub_core.StreamHandle,
     :param frame_width: Width of the frame.
     :param frame_height: Height of the frame.
     """
-    timestamp = int(time.perf_counter_ns() / 1e6)
+    timestamp = time.perf_counter_ns() // 1_000_000
+
+    # Bounding boxes
+    detections = [
+        {'bbox': [*roi], 'label': label, 'color': _BBOX_COLOR}
+        for roi, label in zip(rectangles, rectangle_labels)
+    ]
+
     metadata = {
         "platform": "robothub",
         "frame_shape": [frame_height, frame_width],
-        "config": {
-            "output": {
-                "img_scale": 1.0,
-                "show_fps": False,
-                "clickable": True
-            },
-            "detection": {
-                "thickness": 1,
-                "fill_transparency": 0.05,
-                "box_roundness": 0,
-                "color": [0, 255, 0],
-                "bbox_style": 0,
-                "line_width": 0.5,
-                "line_height": 0.5,
-                "hide_label": False,
-                "label_position": 0,
-                "label_padding": 10
-            },
-            'text': {
-                'font_color': [255, 255, 0],
-                'font_transparency': 0.5,
-                'font_scale': 1.0,
-                'font_thickness': 2,
-                'bg_transparency': 0.5,
-                'bg_color': [0, 0, 0]
-            }
-        },
+        "config": _STATIC_CONFIG,
         "objects": [
             {
                 "type": "detections",
-                "detections": []
+                "detections": detections
             }
         ]
     }
 
-    # Bounding boxes
-    for roi, label in zip(rectangles, rectangle_labels):
-        xmin, ymin, xmax, ymax = roi
-        metadata['objects'][0]['detections'].append(
-            {'bbox': [xmin, ymin, xmax, ymax], 'label': label, 'color': [0, 255, 255]}
-        )
-
     # Texts
-    for text in texts:
-        metadata["objects"].append(text.prepare().serialize())
+    metadata["objects"].extend(text.prepare().serialize() for text in texts)
 
     # Lines
-    for line in lines:
-        metadata["objects"].append(line.prepare().serialize())
+    metadata["objects"].extend(line.prepare().serialize() for line in lines)
 
-    # Publish
-    stream_handle.publish_video_data(bytes(h264_frame), timestamp, metadata)
+    # Publish, frames coming from the device are numpy arrays and have to be converted
+    if not isinstance(h264_frame, bytes):
+        h264_frame = bytes(h264_frame)
+    stream_handle.publish_video_data(h264_frame, timestamp, metadata)
 
 
 class LiveView:
@@ -183,6 +186,12 @@ class LiveView:
         else:
             device.callback(output or component.out.encoded, live_view.frame_buffer.default_callback)
 
+        if unique_key in LIVE_VIEWS:
+            # Replaced key keeps its position in LIVE_VIEWS, mark the name as stale so `get_by_name` rescans it
+            _LIVE_VIEWS_BY_NAME[name] = None
+        else:
+            # First Live View registered under a name is the one returned by `get_by_name`
+            _LIVE_VIEWS_BY_NAME.setdefault(name, live_view)
         LIVE_VIEWS[unique_key] = live_view
         return live_view
 
@@ -199,12 +208,12 @@ class LiveView:
         encoder = device.pipeline.createVideoEncoder()
         encoder_profile = dai.VideoEncoderProperties.Profile.H264_MAIN
         encoder.setDefaultProfilePreset(fps, encoder_profile)
-        encoder.input.setQueueSize(1)
+        encoder.input.setQueueSize(3)
         encoder.input.setBlocking(False)
         encoder.setKeyframeFrequency(int(fps))
         encoder.setBitrate(1500 * 1000)
         encoder.setRateControlMode(dai.VideoEncoderProperties.RateControlMode.CBR)
-        encoder.setNumFramesPool(3)
+        encoder.setNumFramesPool(6)
 
         component.node.video.link(encoder.input)
 
@@ -293,9 +302,16 @@ class LiveView:
         :param name: Name of the Live View.
         :return: Live View with the given name. None if a Live View with the given name does not exist.
         """
+        live_view = _LIVE_VIEWS_BY_NAME.get(name)
+        if live_view is not None and live_view.name == name and LIVE_VIEWS.get(live_view.unique_key) is live_view:
+            return live_view
+
+        # The index is stale, e.g. LIVE_VIEWS was modified directly, fall back to a scan and refresh it
         for live_view in LIVE_VIEWS.values():
             if live_view.name == name:
+                _LIVE_VIEWS_BY_NAME[name] = live_view
                 return live_view
+        _LIVE_VIEWS_BY_NAME.pop(name, None)
         return None
 
     @staticmethod
@@ -330,23 +346,20 @@ class LiveView:
         if self.frame_buffer.maxlen == 0:
             raise Exception('You have set `max_buffer_size` to zero, therefore you cannot use frame buffer.')
 
-        # We need to start a new thread because we cannot block the main thread.
         def on_complete(video_path):
             send_video_event(video_path, title)
 
-        kwargs = {
-            'before_seconds': before_seconds,
-            'after_seconds': after_seconds,
-            'fps': self.fps,
-            'frame_width': self.frame_width,
-            'frame_height': self.frame_height,
-            'on_complete': on_complete,
-            'delete_after_complete': True
-        }
-        t = threading.Thread(target=self.frame_buffer.save_video,
-                             kwargs=kwargs,
-                             daemon=True)
-        t.start()
+        # Video is recorded and muxed in the background because we cannot block the main thread.
+        try:
+            self.frame_buffer.save_video_async(before_seconds=before_seconds,
+                                               after_seconds=after_seconds,
+                                               fps=self.fps,
+                                               frame_width=self.frame_width,
+                                               frame_height=self.frame_height,
+                                               on_complete=on_complete,
+                                               delete_after_complete=True)
+        except (ImportError, ValueError) as e:
+            logger.error(f'Failed to save video event: {e}')
 
     def add_rectangle(self, rectangle: BoundingBox, label: str) -> None:
         """
@@ -445,3 +458,6 @@ class LiveView:
 
 
 LIVE_VIEWS: Dict[str, LiveView] = dict()
+# Name -> first Live View in LIVE_VIEWS with that name, None if it has to be looked up again. Missing name means
+# no Live View has that name.
+_LIVE_VIEWS_BY_NAME: Dict[str, Optional[LiveView]] = dict()
@@ -0,0 +1,131 @@
+import datetime
+import itertools
+import random
+import threading
+import time
+from collections import deque
+
+import pytest
+
+from robothub import frame_buffer as frame_buffer_module
+from robothub.frame_buffer import FrameBuffer
+
+
+class _Message:
+    def __init__(self, timestamp: datetime.timedelta):
+        self._timestamp = timestamp
+
+    def getTimestampDevice(self) -> datetime.timedelta:
+        return self._timestamp
+
+
+class _Packet:
+    def __init__(self, index: int, fps: int = 10):
+        self.index = index
+        self.msg = _Message(datetime.timedelta(seconds=index / fps))
+
+
+@pytest.fixture
+def recording_buffer(monkeypatch):
+    monkeypatch.setattr(frame_buffer_module, 'av', object())
+    monkeypatch.setattr(FrameBuffer, '_mux_video', staticmethod(lambda packets, **kwargs: [p.index for p in packets]))
+    monkeypatch.setattr(FrameBuffer, 'VIDEO_WORKER_IDLE_TIMEOUT', 0.1)
+
+    frame_buffer = FrameBuffer(maxlen=50)
+    for index in range(30):
+        frame_buffer.default_callback(_Packet(index))
+    return frame_buffer
+
+
+def _feed(frame_buffer: FrameBuffer, indices: range) -> None:
+    for index in indices:
+        frame_buffer.default_callback(_Packet(index))
+
+
+@pytest.mark.parametrize('maxlen', [None, 0, 1, 5, 7])
+def test_get_slice_matches_deque(maxlen):
+    rng = random.Random(maxlen)
+    frame_buffer = FrameBuffer(maxlen=maxlen)
+    expected = deque(maxlen=maxlen)
+
+    for packet in range(40):
+        frame_buffer.default_callback(packet)
+        expected.append(packet)
+
+        assert frame_buffer.size == len(expected)
+        assert frame_buffer.snapshot() == list(expected)
+        for _ in range(10):
+            start = rng.randint(0, 12)
+            end = rng.choice([None, rng.randint(0, 12)])
+            assert frame_buffer.get_slice(start, end) == list(itertools.islice(expected, start, end))
+
+
+def test_empty_buffer():
+    frame_buffer = FrameBuffer(maxlen=5)
+
+    assert frame_buffer.size == 0
+    assert frame_buffer.snapshot() == []
+    assert frame_buffer.get_slice(0) == []
+
+
+def test_buffer_is_deprecated_snapshot():
+    frame_buffer = FrameBuffer(maxlen=3)
+    for packet in range(5):
+        frame_buffer.default_callback(packet)
+
+    with pytest.deprecated_call():
+        assert frame_buffer.buffer == [2, 3, 4]
+
+
+def test_callback_stops_feeding_queue_after_window(recording_buffer):
+    recording = recording_buffer._start_recording(before_seconds=1, after_seconds=1, fps=10)
+    temp_queue = recording[1]
+
+    _feed(recording_buffer, range(30, 60))
+
+    # Packet 40 is the first one past the window (2.9 s + 1 s), nothing after it is queued
+    assert recording_buffer._active_queues == ()
+    assert temp_queue.qsize() == 11
+
+    video = recording_buffer._finish_recording(*recording, after_seconds=1, fps=10, frame_width=1, frame_height=1)
+    assert video == list(range(19, 40))
+
+
+def test_save_video_async_hands_off_requests_in_order(recording_buffer):
+    videos = []
+    completed = threading.Event()
+
+    def on_complete(video):
+        videos.append(video)
+        if len(videos) == 2:
+            completed.set()
+
+    recording_buffer.save_video_async(1, 1, fps=10, frame_width=1, frame_height=1, on_complete=on_complete)
+    _feed(recording_buffer, range(30, 35))
+    recording_buffer.save_video_async(1, 1, fps=10, frame_width=1, frame_height=1, on_complete=on_complete)
+    _feed(recording_buffer, range(35, 60))
+
+    assert completed.wait(timeout=5)
+    assert videos == [list(range(19, 40)), list(range(24, 45))]
+    assert recording_buffer._active_queues == ()
+
+
+def test_video_worker_exits_when_idle_and_restarts(recording_buffer):
+    videos = []
+
+    recording_buffer.save_video_async(1, 1, fps=10, frame_width=1, frame_height=1, on_complete=videos.append)
+    first_worker = recording_buffer._video_worker
+    _feed(recording_buffer, range(30, 45))
+
+    first_worker.join(timeout=5)
+    assert not first_worker.is_alive()
+    assert recording_buffer._video_worker is None
+
+    recording_buffer.save_video_async(1, 1, fps=10, frame_width=1, frame_height=1, on_complete=videos.append)
+    assert recording_buffer._video_worker is not first_worker
+    _feed(recording_buffer, range(45, 60))
+
+    deadline = time.monotonic() + 5
+    while len(videos) < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert videos == [list(range(19, 40)), list(range(34, 55))]
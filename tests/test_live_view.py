@@ -0,0 +1,81 @@
+import pytest
+
+from robothub import live_view as live_view_module
+from robothub.live_view import LiveView, LIVE_VIEWS
+
+
+class _Device:
+    def __init__(self, mxid: str = '18443010D1A0F1E900'):
+        self.device = self
+        self._mxid = mxid
+
+    def getMxId(self) -> str:
+        return self._mxid
+
+    def callback(self, output, callback) -> None:
+        pass
+
+
+class _Output:
+    encoded = None
+
+
+class _Component:
+    out = _Output()
+
+
+@pytest.fixture
+def device(monkeypatch):
+    monkeypatch.setattr(live_view_module, 'create_stream_handle', lambda **kwargs: None)
+    monkeypatch.setattr(LiveView, '_is_encoder_enabled', staticmethod(lambda component: True))
+    monkeypatch.setattr(LiveView, '_get_stream_size', staticmethod(lambda component: (1280, 720)))
+    monkeypatch.setattr(LiveView, '_get_component_fps', staticmethod(lambda component: 30))
+    LIVE_VIEWS.clear()
+    live_view_module._LIVE_VIEWS_BY_NAME.clear()
+    yield _Device()
+    LIVE_VIEWS.clear()
+    live_view_module._LIVE_VIEWS_BY_NAME.clear()
+
+
+def _create(device: _Device, name: str, unique_key: str) -> LiveView:
+    return LiveView.create(device, _Component(), name=name, unique_key=unique_key)
+
+
+def test_get_by_name_missing(device):
+    assert LiveView.get_by_name('Color') is None
+
+    _create(device, name='Color', unique_key='color')
+    assert LiveView.get_by_name('Depth') is None
+    assert 'Depth' not in live_view_module._LIVE_VIEWS_BY_NAME
+
+
+def test_get_by_name_recreated_under_same_key(device):
+    first = _create(device, name='Color', unique_key='color')
+    assert LiveView.get_by_name('Color') is first
+
+    second = _create(device, name='Color', unique_key='color')
+    assert LiveView.get_by_name('Color') is second
+    assert list(LIVE_VIEWS.values()) == [second]
+
+
+def test_get_by_name_renamed_under_same_key(device):
+    _create(device, name='Color', unique_key='color')
+    assert LiveView.get_by_name('Color') is not None
+
+    renamed = _create(device, name='Front', unique_key='color')
+    assert LiveView.get_by_name('Front') is renamed
+    assert LiveView.get_by_name('Color') is None
+
+
+def test_get_by_name_shared_name_returns_first_registered(device):
+    first = _create(device, name='Color', unique_key='color_1')
+    _create(device, name='Color', unique_key='color_2')
+    assert LiveView.get_by_name('Color') is first
+
+    # Re-creating the first key keeps its position in LIVE_VIEWS, so it is still the one returned
+    replaced = _create(device, name='Color', unique_key='color_1')
+    assert LiveView.get_by_name('Color') is replaced
+
+    # Renaming the first key leaves the second Live View as the only one with the name
+    _create(device, name='Front', unique_key='color_1')
+    assert LiveView.get_by_name('Color') is LIVE_VIEWS['color_2']